@@ -78,6 +78,9 @@ class Rect:
     All points are inclusive (are part of the rectangle).
     """
 
+    # ONHOLD: Use @dataclass(slots=True) with Python 3.10
+    __slots__ = ("left", "top", "right", "bottom")  # noqa: RUF023 # field order
+
     left: int
     top: int
     right: int
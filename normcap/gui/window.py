@@ -24,6 +24,24 @@ from normcap.gui.settings import Settings
 logger = logging.getLogger(__name__)
 
 
+def _move_window_on_gnome(title_id: str, position: Rect) -> bool:
+    """Move window via extension, fall back to shell eval if not installed."""
+    return dbus.move_windows_via_window_calls_extension(
+        title_id=title_id, position=position
+    ) or dbus.move_window_via_gnome_shell_eval(title_id=title_id, position=position)
+
+
+def _move_window_on_kde(title_id: str, position: Rect) -> bool:
+    """Move window via KWin script."""
+    return dbus.move_window_via_kde_kwin_scripting(title_id=title_id, position=position)
+
+
+_wayland_move_handlers: dict[DesktopEnvironment, Callable[..., bool]] = {
+    DesktopEnvironment.GNOME: _move_window_on_gnome,
+    DesktopEnvironment.KDE: _move_window_on_kde,
+}
+
+
 @dataclass
 class DebugInfo:
     screen: Optional[Screen] = None
@@ -64,7 +82,17 @@ class Window(QtWidgets.QMainWindow):
 
         self.selection_rect: QtCore.QRect = QtCore.QRect()
 
+        # Coalesce repaints of high frequency mouse move events into one per
+        # event loop iteration
+        self._update_timer = QtCore.QTimer(parent=self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(0)
+        self._update_timer.timeout.connect(self._update_selection)
+
         self._add_image_container()
+        # Ratio between screenshot and window size. Updated on resize, so it
+        # doesn't need to be calculated on every selection.
+        self.scale_factor: float = self._get_scale_factor()
         self._add_ui_container()
 
     def _get_scale_factor(self) -> float:
@@ -81,13 +109,11 @@ class Window(QtWidgets.QMainWindow):
 
     def _add_ui_container(self) -> None:
         """Add widget for showing selection rectangle and settings button."""
-        self.ui_container = UiContainerLabel(
-            parent=self, color=self.color, capture_mode_func=self.get_capture_mode
-        )
+        self.ui_container = UiContainerLabel(parent=self, color=self.color)
 
         if logger.getEffectiveLevel() is logging.DEBUG:
             self.ui_container.debug_info = DebugInfo(
-                scale_factor=self._get_scale_factor(), screen=self.screen_, window=self
+                scale_factor=self.scale_factor, screen=self.screen_, window=self
             )
 
         self.ui_container.color = self.color
@@ -106,22 +132,12 @@ class Window(QtWidgets.QMainWindow):
         In Wayland, the compositor has the responsibility for positioning windows, the
         client itself can't do this. However, there are DE dependent workarounds.
         """
-        if system_info.desktop_environment() == DesktopEnvironment.GNOME:
-            result = dbus.move_windows_via_window_calls_extension(
-                title_id=self.windowTitle(), position=self.screen_
-            )
-            if not result:
-                dbus.move_window_via_gnome_shell_eval(
-                    title_id=self.windowTitle(), position=self.screen_
-                )
-        elif system_info.desktop_environment() == DesktopEnvironment.KDE:
-            dbus.move_window_via_kde_kwin_scripting(
-                title_id=self.windowTitle(), position=self.screen_
-            )
-        else:
-            logger.warning(
-                "No window move method for %s", system_info.desktop_environment()
-            )
+        desktop_environment = system_info.desktop_environment()
+        move_handler = _wayland_move_handlers.get(desktop_environment)
+        if not move_handler:
+            logger.warning("No window move method for %s", desktop_environment)
+            return
+        move_handler(title_id=self.windowTitle(), position=self.screen_)
 
     def set_fullscreen(self) -> None:
         """Set window to full screen using platform specific methods."""
@@ -167,9 +183,13 @@ class Window(QtWidgets.QMainWindow):
             QtCore.QTimer.singleShot(20, lambda: self._move_to_position_on_wayland())
 
     def clear_selection(self) -> None:
+        self._update_timer.stop()
         self.selection_rect = QtCore.QRect()
-        self.ui_container.rect = self.selection_rect
-        self.update()
+        self.ui_container.update_rect(self.selection_rect)
+
+    def _update_selection(self) -> None:
+        """Propagate current selection rectangle to the ui container."""
+        self.ui_container.update_rect(self.selection_rect)
 
     def get_capture_mode(self) -> CaptureMode:
         """Read current capture mode from application settings."""
@@ -208,16 +228,21 @@ class Window(QtWidgets.QMainWindow):
             self.selection_rect = QtCore.QRect()
             self.selection_rect.setTopLeft(event.position().toPoint())
             self.selection_rect.setBottomRight(event.position().toPoint())
-            self.ui_container.rect = self.selection_rect
-            self.update()
+            # Read mode once per selection, as it can't change while selecting
+            self.ui_container.capture_mode = self.get_capture_mode()
+            self.ui_container.update_rect(self.selection_rect)
 
     def mouseMoveEvent(self, event: QtGui.QMouseEvent) -> None:  # noqa: N802
-        """Update position of bottom right point of selection rectangle."""
+        """Update position of bottom right point of selection rectangle.
+
+        The repaint is deferred to the next event loop iteration, so that a burst of
+        move events (e.g. from high polling rate mice) results in one update only.
+        """
         super().mouseMoveEvent(event)
         if self.selection_rect:
             self.selection_rect.setBottomRight(event.position().toPoint())
-            self.ui_container.rect = self.selection_rect
-            self.update()
+            if not self._update_timer.isActive():
+                self._update_timer.start()
 
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent) -> None:  # noqa: N802
         """Start OCR workflow on left mouse button release."""
@@ -231,7 +256,7 @@ class Window(QtWidgets.QMainWindow):
         self.selection_rect.setBottomRight(event.position().toPoint())
 
         selection_coords = cast(tuple, self.selection_rect.normalized().getCoords())
-        scaled_selection_rect = Rect(*selection_coords).scale(self._get_scale_factor())
+        scaled_selection_rect = Rect(*selection_coords).scale(self.scale_factor)
 
         self.clear_selection()
 
@@ -242,8 +267,9 @@ class Window(QtWidgets.QMainWindow):
         """Adjust child widget on resize."""
         super().resizeEvent(event)
         self.ui_container.resize(self.size())
+        self.scale_factor = self._get_scale_factor()
         if self.ui_container.debug_info:
-            self.ui_container.debug_info.scale_factor = self._get_scale_factor()
+            self.ui_container.debug_info.scale_factor = self.scale_factor
 
     def showEvent(self, event: QtGui.QShowEvent) -> None:  # noqa: N802
         """Update background image on show/reshow."""
@@ -258,23 +284,78 @@ class UiContainerLabel(QtWidgets.QLabel):
         self,
         parent: QtWidgets.QWidget,
         color: QtGui.QColor,
-        capture_mode_func: Callable,
     ) -> None:
         super().__init__(parent)
 
         self.color: QtGui.QColor = color
 
         self.debug_info: Optional[DebugInfo] = None
+        self.debug_font = QtGui.QFont(QtGui.QFont().family(), 10, 600)
+        self.debug_background_color = QtGui.QColor(0, 0, 0, 175)
+        self.transparent_color = QtGui.QColor(0, 0, 0, 0)
 
         self.rect: QtCore.QRect = QtCore.QRect()
         self.rect_pen = QtGui.QPen(self.color, 2, QtCore.Qt.PenStyle.DashLine)
-        self.get_capture_mode = capture_mode_func
+        self._prev_paint_region: QtGui.QRegion = QtGui.QRegion()
+        self.capture_mode: CaptureMode = CaptureMode.PARSE
+        self.mode_icons: dict[CaptureMode, QtGui.QIcon] = {
+            CaptureMode.PARSE: QtGui.QIcon(":parse"),
+            CaptureMode.RAW: QtGui.QIcon(":raw"),
+        }
+        self._mode_pixmaps: dict[tuple[CaptureMode, float], QtGui.QPixmap] = {}
 
         self.setObjectName("ui_container")
         self.setStyleSheet(f"#ui_container {{border: 3px solid {self.color.name()};}}")
         self.setCursor(QtCore.Qt.CursorShape.CrossCursor)
         self.setScaledContents(True)
 
+    @staticmethod
+    def _get_mode_icon_rect(rect: QtCore.QRect) -> QtCore.QRect:
+        """Get position of the mode indicator icon above the selection's corner."""
+        return QtCore.QRect(rect.right() - 24, rect.top() - 30, 24, 24)
+
+    def _get_mode_pixmap(self) -> QtGui.QPixmap:
+        """Get icon of current mode, rendered only once per device pixel ratio."""
+        key = (self.capture_mode, self.devicePixelRatio())
+        if key not in self._mode_pixmaps:
+            self._mode_pixmaps[key] = self.mode_icons[self.capture_mode].pixmap(
+                QtCore.QSize(24, 24), self.devicePixelRatio()
+            )
+        return self._mode_pixmaps[key]
+
+    def _get_paint_region(self, rect: QtCore.QRect) -> QtGui.QRegion:
+        """Get region covered when drawing the (normalized) selection and its icon.
+
+        Only the border of the selection is part of the region, as its inside is
+        not painted on.
+        """
+        if not rect:
+            return QtGui.QRegion()
+        margin = self.rect_pen.width() + 1
+        outer = QtGui.QRegion(rect.adjusted(-margin, -margin, margin, margin))
+        inner = QtGui.QRegion(rect.adjusted(margin, margin, -margin, -margin))
+        return outer.subtracted(inner).united(self._get_mode_icon_rect(rect))
+
+    def update_rect(self, rect: QtCore.QRect) -> None:
+        """Set selection rectangle and schedule repaint of the affected region.
+
+        Only the union of the previously and the currently drawn border gets
+        invalidated, so the pixels to repaint on every mouse move scale with the
+        selection's perimeter instead of the (fullscreen) widget's area.
+
+        The rectangle is normalized once here, so paint events can use it as is.
+        """
+        self.rect = rect.normalized()
+
+        if self.debug_info:
+            # Debug infos reflect the selection, so the whole widget is outdated
+            self.update()
+            return
+
+        paint_region = self._get_paint_region(self.rect)
+        self.update(paint_region.united(self._prev_paint_region))
+        self._prev_paint_region = paint_region
+
     def _draw_debug_infos(self, painter: QtGui.QPainter, rect: QtCore.QRect) -> None:
         """Draw debug information to top left."""
         if (
@@ -285,7 +366,7 @@ class UiContainerLabel(QtWidgets.QLabel):
         ):
             return
 
-        selection = Rect(*cast(tuple, rect.normalized().getCoords()))
+        selection = Rect(*cast(tuple, rect.getCoords()))
         selection_scaled = selection.scale(self.debug_info.scale_factor)
 
         lines = (
@@ -308,13 +389,13 @@ class UiContainerLabel(QtWidgets.QLabel):
             f"Factor: {self.debug_info.scale_factor:.2f}",
         )
 
-        painter.setPen(QtGui.QColor(0, 0, 0, 0))
-        painter.setBrush(QtGui.QColor(0, 0, 0, 175))
+        painter.setPen(self.transparent_color)
+        painter.setBrush(self.debug_background_color)
         painter.drawRect(3, 3, 300, 20 * len(lines) + 5)
-        painter.setBrush(QtGui.QColor(0, 0, 0, 0))
+        painter.setBrush(self.transparent_color)
 
         painter.setPen(self.color)
-        painter.setFont(QtGui.QFont(QtGui.QFont().family(), 10, 600))
+        painter.setFont(self.debug_font)
         for idx, line in enumerate(lines):
             painter.drawText(10, 20 * (idx + 1), line)
 
@@ -326,21 +407,16 @@ class UiContainerLabel(QtWidgets.QLabel):
             return
 
         painter = QtGui.QPainter(self)
-        self.rect = self.rect.normalized()
 
         if self.debug_info:
             self._draw_debug_infos(painter, self.rect)
 
-        if not self.rect:
-            return
-
-        painter.setPen(self.rect_pen)
-        painter.drawRect(self.rect)
+        if self.rect:
+            painter.setPen(self.rect_pen)
+            painter.drawRect(self.rect)
 
-        if self.get_capture_mode() is CaptureMode.PARSE:
-            mode_icon = QtGui.QIcon(":parse")
-        else:
-            mode_icon = QtGui.QIcon(":raw")
-        mode_icon.paint(painter, self.rect.right() - 24, self.rect.top() - 30, 24, 24)
+            painter.drawPixmap(
+                self._get_mode_icon_rect(self.rect), self._get_mode_pixmap()
+            )
 
         painter.end()
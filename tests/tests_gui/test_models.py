@@ -93,3 +93,14 @@ def test_screen_scale_coords(
 
     # THEN it should result in certain scaled coords
     assert screen_scaled.coords == expected_scaled_coords
+
+
+def test_rect_has_no_instance_dict():
+    # GIVEN an initialized rect
+    rect = Rect(left=10, top=20, right=110, bottom=220)
+
+    # WHEN an attribute not being a coordinate is set
+    # THEN it should fail, as the coordinates are stored in slots
+    assert not hasattr(rect, "__dict__")
+    with pytest.raises(AttributeError):
+        rect.foo = 1  # type: ignore
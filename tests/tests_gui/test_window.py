@@ -139,3 +139,262 @@ def test_window_get_capture_mode_fallback_to_parse(temp_settings, caplog):
     assert "unknown capture mode" in caplog.text.lower()
     assert invalid_mode in caplog.text.lower()
     assert mode == models.CaptureMode.PARSE
+
+
+@pytest.mark.gui()
+def test_ui_container_update_rect_invalidates_old_and_new_border(
+    qtbot, temp_settings, monkeypatch
+):
+    # GIVEN a window with a selection rectangle drawn
+    image = QtGui.QImage(600, 400, QtGui.QImage.Format.Format_RGB32)
+    screen = models.Screen(
+        device_pixel_ratio=1.0,
+        left=0,
+        top=0,
+        right=600,
+        bottom=400,
+        index=0,
+        screenshot=image,
+    )
+    win = window.Window(screen=screen, settings=temp_settings, parent=None)
+    qtbot.add_widget(win)
+    updated_regions = []
+    monkeypatch.setattr(win.ui_container, "update", updated_regions.append)
+    old_rect = QtCore.QRect(QtCore.QPoint(100, 100), QtCore.QPoint(200, 200))
+    win.ui_container.update_rect(old_rect)
+    old_icon_rect = win.ui_container._get_mode_icon_rect(old_rect)
+
+    # WHEN the selection rectangle is changed
+    new_rect = QtCore.QRect(QtCore.QPoint(100, 100), QtCore.QPoint(50, 300))
+    win.ui_container.update_rect(new_rect)
+
+    # THEN the repainted region should include the old border and mode icon
+    #   and the new border and mode icon
+    #   but neither the inside of the new selection nor the whole widget
+    new_rect = new_rect.normalized()
+    new_icon_rect = win.ui_container._get_mode_icon_rect(new_rect)
+    paint_region = updated_regions[-1]
+    for point in (
+        old_rect.topLeft(),
+        old_rect.bottomRight(),
+        old_icon_rect.center(),
+        new_rect.topLeft(),
+        new_rect.bottomRight(),
+        new_rect.topRight(),
+        new_icon_rect.center(),
+    ):
+        assert paint_region.contains(point)
+    assert not paint_region.contains(new_rect.center())
+    assert not paint_region.contains(QtCore.QPoint(500, 350))
+
+    # WHEN the selection is cleared
+    win.clear_selection()
+
+    # THEN the last drawn border and mode icon should be repainted
+    paint_region = updated_regions[-1]
+    for point in (new_rect.topLeft(), new_rect.bottomRight(), new_icon_rect.center()):
+        assert paint_region.contains(point)
+    assert not paint_region.contains(old_rect.bottomRight())
+
+
+@pytest.mark.gui()
+def test_window_mouse_move_coalesces_updates(qtbot, temp_settings, monkeypatch):
+    # GIVEN a window with an ongoing selection
+    image = QtGui.QImage(600, 400, QtGui.QImage.Format.Format_RGB32)
+    screen = models.Screen(
+        device_pixel_ratio=1.0,
+        left=0,
+        top=0,
+        right=600,
+        bottom=400,
+        index=0,
+        screenshot=image,
+    )
+    win = window.Window(screen=screen, settings=temp_settings, parent=None)
+    qtbot.add_widget(win)
+    qtbot.mousePress(win, QtCore.Qt.MouseButton.LeftButton, pos=QtCore.QPoint(10, 10))
+
+    updated_rects = []
+    monkeypatch.setattr(
+        win.ui_container,
+        "update_rect",
+        lambda rect: updated_rects.append(rect.getCoords()),
+    )
+
+    # WHEN the mouse is moved several times within one event loop iteration
+    for pos in (20, 30, 40):
+        event = QtGui.QMouseEvent(
+            QtCore.QEvent.Type.MouseMove,
+            QtCore.QPointF(pos, pos),
+            QtCore.QPointF(pos, pos),
+            QtCore.Qt.MouseButton.NoButton,
+            QtCore.Qt.MouseButton.LeftButton,
+            QtCore.Qt.KeyboardModifier.NoModifier,
+        )
+        win.mouseMoveEvent(event)
+
+    # THEN the selection should be updated immediately
+    #   but the ui container should be updated only once, with the latest position
+    assert win.selection_rect.bottomRight() == QtCore.QPoint(40, 40)
+    assert not updated_rects
+    qtbot.waitUntil(lambda: len(updated_rects) == 1)
+    assert updated_rects == [(10, 10, 40, 40)]
+
+
+@pytest.mark.gui()
+def test_window_mouse_release_emits_scaled_selection(qtbot, temp_settings):
+    # GIVEN a window is shown
+    #   with a screenshot twice as large as the window
+    image = QtGui.QImage(1200, 800, QtGui.QImage.Format.Format_RGB32)
+    screen = models.Screen(
+        device_pixel_ratio=1.0,
+        left=0,
+        top=0,
+        right=599,
+        bottom=399,
+        index=0,
+        screenshot=image,
+    )
+    win = window.Window(screen=screen, settings=temp_settings, parent=None)
+    qtbot.add_widget(win)
+    win.resize(QtCore.QSize(600, 400))
+    win.show()
+    qtbot.waitExposed(win)
+
+    # WHEN a region is selected
+    qtbot.mousePress(win, QtCore.Qt.MouseButton.LeftButton, pos=QtCore.QPoint(10, 20))
+    with qtbot.waitSignal(win.com.on_region_selected, timeout=1000) as result:
+        qtbot.mouseRelease(
+            win, QtCore.Qt.MouseButton.LeftButton, pos=QtCore.QPoint(50, 40)
+        )
+
+    # THEN the selection should be emitted in screenshot coordinates
+    rect, screen_idx = result.args[0]
+    assert rect.coords == (20, 40, 100, 80)
+    assert screen_idx == 0
+
+
+@pytest.mark.parametrize(
+    ("desktop_environment", "extension_result", "expected_calls"),
+    [
+        (models.DesktopEnvironment.GNOME, True, ["extension"]),
+        (models.DesktopEnvironment.GNOME, False, ["extension", "shell_eval"]),
+        (models.DesktopEnvironment.KDE, True, ["kwin"]),
+        (models.DesktopEnvironment.SWAY, True, []),
+    ],
+)
+def test_window_move_to_position_on_wayland(
+    temp_settings, monkeypatch, desktop_environment, extension_result, expected_calls
+):
+    # GIVEN a window on a certain desktop environment
+    image = QtGui.QImage(600, 400, QtGui.QImage.Format.Format_RGB32)
+    screen = models.Screen(
+        device_pixel_ratio=1.0,
+        left=0,
+        top=0,
+        right=600,
+        bottom=400,
+        index=0,
+        screenshot=image,
+    )
+    win = window.Window(screen=screen, settings=temp_settings, parent=None)
+    monkeypatch.setattr(
+        window.system_info, "desktop_environment", lambda: desktop_environment
+    )
+
+    calls = []
+
+    def mocked_move(name, result):
+        def _move(title_id, position):
+            calls.append(name)
+            return result
+
+        return _move
+
+    monkeypatch.setattr(
+        window.dbus,
+        "move_windows_via_window_calls_extension",
+        mocked_move("extension", extension_result),
+    )
+    monkeypatch.setattr(
+        window.dbus, "move_window_via_gnome_shell_eval", mocked_move("shell_eval", True)
+    )
+    monkeypatch.setattr(
+        window.dbus, "move_window_via_kde_kwin_scripting", mocked_move("kwin", True)
+    )
+
+    # WHEN the window is moved to its position
+    win._move_to_position_on_wayland()
+
+    # THEN the desktop environment specific methods should be used
+    assert calls == expected_calls
+
+
+@pytest.mark.gui()
+@pytest.mark.parametrize("mode", ["raw", "parse"])
+def test_window_mouse_press_sets_capture_mode(qtbot, temp_settings, mode):
+    # GIVEN a window with a certain capture mode setting
+    image = QtGui.QImage(600, 400, QtGui.QImage.Format.Format_RGB32)
+    screen = models.Screen(
+        device_pixel_ratio=1.0,
+        left=0,
+        top=0,
+        right=600,
+        bottom=400,
+        index=0,
+        screenshot=image,
+    )
+    temp_settings.setValue("mode", mode)
+    win = window.Window(screen=screen, settings=temp_settings, parent=None)
+    qtbot.add_widget(win)
+
+    # WHEN a selection is started
+    qtbot.mousePress(win, QtCore.Qt.MouseButton.LeftButton, pos=QtCore.QPoint(10, 10))
+
+    # THEN the ui container should show the icon of the current mode
+    assert win.ui_container.capture_mode == models.CaptureMode[mode.upper()]
+
+
+@pytest.mark.gui()
+def test_ui_container_renders_mode_icon_once(qtbot, temp_settings):
+    # GIVEN a window
+    image = QtGui.QImage(600, 400, QtGui.QImage.Format.Format_RGB32)
+    screen = models.Screen(
+        device_pixel_ratio=1.0,
+        left=0,
+        top=0,
+        right=600,
+        bottom=400,
+        index=0,
+        screenshot=image,
+    )
+    win = window.Window(screen=screen, settings=temp_settings, parent=None)
+    qtbot.add_widget(win)
+
+    # WHEN the mode icon is requested several times
+    pixmaps = [win.ui_container._get_mode_pixmap() for _ in range(3)]
+
+    # THEN it should be rendered only once in the required size
+    assert len(win.ui_container._mode_pixmaps) == 1
+    assert all(p.cacheKey() == pixmaps[0].cacheKey() for p in pixmaps)
+    assert pixmaps[0].deviceIndependentSize().toSize() == QtCore.QSize(24, 24)
+
+
+def test_window_scale_factor_is_set_on_init(temp_settings):
+    # GIVEN a screenshot twice as large as the window
+    image = QtGui.QImage(1200, 800, QtGui.QImage.Format.Format_RGB32)
+    screen = models.Screen(
+        device_pixel_ratio=1.0,
+        left=0,
+        top=0,
+        right=599,
+        bottom=399,
+        index=0,
+        screenshot=image,
+    )
+
+    # WHEN the window is created, before any resize event was handled
+    win = window.Window(screen=screen, settings=temp_settings, parent=None)
+
+    # THEN the cached scale factor should already be correct
+    assert win.scale_factor == win._get_scale_factor()